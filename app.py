@@ -13,10 +13,10 @@ st.set_page_config(
 )
 
 # Import custom modules
-from news_fetcher import get_news
+from news_fetcher import get_cached_news
 from text_processor import create_econoclip, simplify_terms
 from url_analyzer import extract_from_url
-from image_analyzer import extract_from_image
+from image_analyzer import extract_from_images, stitch_texts
 from preloader import summarizer_model
 
 
@@ -55,12 +55,11 @@ st.markdown("""
 
 
 
-# Cache mechanism for news
-@st.cache_data(ttl=3600)  # Cache for 1 hour
+# Cache mechanism for news (stale-while-revalidate, shared across sessions)
 def cached_news(category):
     # Get API key from secrets
     api_key = st.secrets["NEWS_API_KEY"]
-    return get_news(api_key, category)
+    return get_cached_news(api_key, category)
 
 # Sidebar for navigation
 with st.sidebar:
@@ -86,7 +85,22 @@ tab1, tab2, tab3 = st.tabs(["Daily News", "URL Analysis", "Screenshot Analysis"]
 with tab1:
     if st.button("Get Latest Economic News", key="fetch_news"):
         with st.spinner("Fetching the latest economic news..."):
-            news = cached_news(category)
+            result = cached_news(category)
+            news = result["data"]
+            
+            # Freshness indicator for cached news
+            if result["fetched_at"]:
+                age_minutes = int((time.time() - result["fetched_at"]) // 60)
+                if result["error"]:
+                    st.warning(f"Could not reach the news service. Showing news from {age_minutes} min ago.")
+                elif result["stale"]:
+                    st.info(f"Showing news from {age_minutes} min ago while we refresh in the background.")
+                else:
+                    st.caption(f"Updated {age_minutes} min ago")
+            elif result["pending"]:
+                st.info("The latest news is still loading. Please try again in a moment.")
+            elif result["error"]:
+                st.error("Could not reach the news service. Please try again in a few minutes.")
             
             if news and news.get("articles"):
                 for i, article in enumerate(news["articles"][:5]):
@@ -116,7 +130,7 @@ with tab1:
                                 st.error("Not enough content to create a summary.")
 
                         st.markdown("---")
-            else:
+            elif not result["error"] and not result["pending"]:
                 st.error("No news articles found. Please try again later.")
 
 # Tab 2: URL Analysis
@@ -137,14 +151,27 @@ with tab2:
 # Tab 3: Screenshot Analysis
 with tab3:
     st.header("Analyze a Screenshot of Economic News")
-    uploaded_file = st.file_uploader("Upload a screenshot of economic news", type=["jpg", "png", "jpeg"])
+    uploaded_files = st.file_uploader(
+        "Upload one or more screenshots of economic news (in reading order)",
+        type=["jpg", "png", "jpeg"],
+        accept_multiple_files=True
+    )
     
-    if uploaded_file and st.button("Analyze Screenshot"):
-        image = Image.open(uploaded_file)
-        st.image(image, caption="Uploaded Screenshot", width=400)
+    if uploaded_files and st.button("Analyze Screenshot"):
+        images_bytes = [f.getvalue() for f in uploaded_files]
+        
+        if len(uploaded_files) == 1:
+            st.image(Image.open(io.BytesIO(images_bytes[0])), caption="Uploaded Screenshot", width=400)
+        else:
+            cols = st.columns(min(len(uploaded_files), 3))
+            for i, image_bytes in enumerate(images_bytes):
+                with cols[i % len(cols)]:
+                    st.image(Image.open(io.BytesIO(image_bytes)), caption=f"Screenshot {i + 1}", width=200)
         
         with st.spinner("Extracting text and analyzing..."):
-            text = extract_from_image(image)
+            # OCR all screenshots in parallel, then stitch them into one article
+            texts = extract_from_images(images_bytes)
+            text = stitch_texts(texts)
             if text and len(text) > 50:  # Minimum content check
                 simplified = create_econoclip(text, summarizer_model)
                 st.markdown("### 30-Second Explanation:")
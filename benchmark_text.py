@@ -0,0 +1,66 @@
+import random
+import time
+
+from text_processor import clean_text, clean_text_batch
+from image_analyzer import clean_ocr_text, clean_ocr_text_batch
+
+WORDS = [
+    "inflation", "rose", "GDP", "markets", "the", "Federal", "Reserve", "said",
+    "investors", "bonds", "yield", "growth", "slowed", "in", "quarter", "rates",
+]
+NOISE = ["<p>", "</p>", "<b>", "\n", "\n\n", "\t", "  ", "\x0c", "\x07", "[+2900 chars]"]
+
+def make_articles(count, seed=0):
+    """
+    Generates synthetic article texts with HTML, OCR noise and NewsAPI suffixes.
+
+    Args:
+        count (int): Number of articles
+        seed (int): Random seed
+
+    Returns:
+        list: Article texts
+    """
+    rng = random.Random(seed)
+    articles = []
+    for _ in range(count):
+        parts = []
+        for _ in range(rng.randint(40, 120)):
+            parts.append(rng.choice(WORDS))
+            roll = rng.random()
+            if roll < 0.08:
+                parts.append(rng.choice(".!?") + " ")
+            elif roll < 0.15:
+                parts.append(rng.choice(NOISE))
+            else:
+                parts.append(" ")
+        articles.append("".join(parts))
+    return articles
+
+def compare(name, scalar, batch, texts):
+    """
+    Times a scalar function against its batch version and checks the outputs match.
+
+    Args:
+        name (str): Label for the report
+        scalar (callable): Function applied to each text
+        batch (callable): Function applied to all texts
+        texts (list): Input texts
+    """
+    start = time.perf_counter()
+    expected = [scalar(t) for t in texts]
+    scalar_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = batch(texts)
+    batch_time = time.perf_counter() - start
+
+    assert list(result) == expected, f"{name}: batch output differs from scalar output"
+    print(f"{name:<20} {len(texts):>7} texts  scalar {scalar_time:7.3f}s  "
+          f"batch {batch_time:7.3f}s  speedup {scalar_time / batch_time:5.2f}x")
+
+if __name__ == "__main__":
+    for count in (10_000, 100_000):
+        articles = make_articles(count)
+        compare("clean_text", clean_text, clean_text_batch, articles)
+        compare("clean_ocr_text", clean_ocr_text, clean_ocr_text_batch, articles)
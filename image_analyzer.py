@@ -2,14 +2,35 @@ import pytesseract
 from PIL import Image
 import cv2
 import numpy as np
+import pandas as pd
 import logging
 import io
+import os
+import re
+import difflib
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import streamlit as st
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Batch cleaning joins texts with a NUL separator. Texts that contain NUL or
+# characters outside the Basic Multilingual Plane use the per-character check.
+_BATCH_SENTINEL = '\x00'
+
+# Translate table deleting the non-printable characters of the Basic Multilingual
+# Plane. Newlines are kept, as in clean_ocr_text, and so is the batch separator.
+_NON_PRINTABLE_TABLE = {
+    i: None for i in range(0x10000)
+    if not chr(i).isprintable() and chr(i) not in ('\n', _BATCH_SENTINEL)
+}
+_ASTRAL_RE = re.compile('[\U00010000-\U0010FFFF]')
+_SCALAR_ONLY_RE = re.compile(f'[{_BATCH_SENTINEL}\U00010000-\U0010FFFF]')
+
 def extract_from_image(image):
     """
     Extracts text from an image using OCR.
@@ -117,6 +138,38 @@ def clean_ocr_text(text):
     
     return text
 
+def clean_ocr_text_batch(texts):
+    """
+    Batch version of clean_ocr_text for many OCR results at once.
+    
+    The texts are joined into one string so the translate table and the
+    whitespace split run once over the whole batch.
+    
+    Args:
+        texts (pandas.Series or list): Raw OCR texts (None or empty for failed OCR)
+        
+    Returns:
+        pandas.Series: Cleaned texts, identical to clean_ocr_text applied to each item
+    """
+    texts = pd.Series(texts, dtype=object).where(lambda t: t.notna(), "")
+    joined = _BATCH_SENTINEL.join(texts)
+    
+    # Texts containing the separator or characters outside the BMP use the scalar path
+    if joined.count(_BATCH_SENTINEL) != max(len(texts) - 1, 0) or _ASTRAL_RE.search(joined):
+        scalar_rows = texts.str.contains(_SCALAR_ONLY_RE, regex=True)
+        cleaned = texts.copy()
+        cleaned[scalar_rows] = texts[scalar_rows].map(clean_ocr_text)
+        cleaned[~scalar_rows] = clean_ocr_text_batch(texts[~scalar_rows])
+        return cleaned
+    
+    # Blank lines disappear when whitespace is collapsed, so only non-printable
+    # characters need removing first
+    joined = joined.translate(_NON_PRINTABLE_TABLE)
+    joined = ' '.join(joined.split())
+    
+    cleaned = [text.strip() for text in joined.split(_BATCH_SENTINEL)] if len(texts) else []
+    return pd.Series(cleaned, index=texts.index, dtype=object)
+
 @st.cache_data
 def cached_image_extract(image_bytes):
     """
@@ -129,4 +182,179 @@ def cached_image_extract(image_bytes):
         str: Extracted text or None if error
     """
     image = Image.open(io.BytesIO(image_bytes))
-    return extract_from_image(image)
\ No newline at end of file
+    return extract_from_image(image)
+
+def _extract_from_bytes(image_bytes):
+    """
+    Worker for batch OCR. Takes raw bytes so images are cheap to send to a process.
+    
+    Args:
+        image_bytes (bytes): Image file bytes
+        
+    Returns:
+        str: Extracted text or None if error
+    """
+    image = Image.open(io.BytesIO(image_bytes))
+    return extract_from_image(image)
+
+# Long-lived OCR pool shared by all sessions. Workers are started with "spawn":
+# the Streamlit server is multithreaded and has torch loaded, and forking such a
+# process can deadlock the child. Spawning a worker and importing cv2/streamlit in
+# it takes a few seconds, so the pool is created once and warmed at startup by
+# preloader.py. Tesseract is itself multithreaded (OpenMP); each worker limits it
+# to one thread so parallel pages don't oversubscribe the CPU.
+OCR_MAX_WORKERS = min(os.cpu_count() or 1, 6)  # Long articles span 3-6 screenshots
+_ocr_pool = None
+_ocr_pool_lock = threading.Lock()
+
+def _init_ocr_worker():
+    """Limits tesseract to a single OpenMP thread inside a pool worker."""
+    os.environ["OMP_THREAD_LIMIT"] = "1"
+
+def _warm_ocr_worker():
+    """No-op task used to start pool workers ahead of the first batch."""
+    return None
+
+def _get_ocr_pool():
+    """
+    Returns the shared OCR process pool, creating it on first use.
+    
+    Returns:
+        concurrent.futures.ProcessPoolExecutor: Process pool for OCR
+    """
+    global _ocr_pool
+    with _ocr_pool_lock:
+        if _ocr_pool is None:
+            _ocr_pool = ProcessPoolExecutor(
+                max_workers=OCR_MAX_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_ocr_worker
+            )
+        return _ocr_pool
+
+def warm_ocr_pool():
+    """
+    Starts the OCR worker processes in the background without waiting for them,
+    so the first multi-screenshot upload doesn't pay the spawn start-up cost.
+    """
+    try:
+        pool = _get_ocr_pool()
+        for _ in range(OCR_MAX_WORKERS):
+            pool.submit(_warm_ocr_worker)
+        logger.info(f"Warming OCR pool with {OCR_MAX_WORKERS} workers")
+    except Exception as e:
+        logger.error(f"Error warming OCR pool: {str(e)}")
+
+def _reset_ocr_pool():
+    """Drops a broken OCR pool so the next batch starts a fresh one."""
+    global _ocr_pool
+    with _ocr_pool_lock:
+        if _ocr_pool is not None:
+            _ocr_pool.shutdown(wait=False)
+            _ocr_pool = None
+
+def extract_from_images(images_bytes):
+    """
+    Extracts text from several images in parallel using a process pool.
+    
+    Args:
+        images_bytes (list): Image file bytes, in reading order
+        
+    Returns:
+        list: Extracted text (or None) for each image, in the same order
+    """
+    if not images_bytes:
+        return []
+    if len(images_bytes) == 1:
+        return [_extract_from_bytes(images_bytes[0])]
+    
+    try:
+        texts = list(_get_ocr_pool().map(_extract_from_bytes, images_bytes))
+        logger.info(f"Extracted text from {len(texts)} images in parallel")
+        return texts
+    except Exception as e:
+        logger.error(f"Error in parallel OCR, falling back to sequential: {str(e)}")
+        if isinstance(e, BrokenProcessPool):
+            _reset_ocr_pool()
+        return [_extract_from_bytes(b) for b in images_bytes]
+
+def _normalize_word(word):
+    """Lowercases a word and strips punctuation so OCR noise doesn't break matching."""
+    return re.sub(r'[^\w]', '', word.lower())
+
+def remove_overlap(previous, current, window=60, min_overlap_words=4, slack=3, lead_slack=5,
+                   min_ratio=0.8):
+    """
+    Removes text at the start of a screenshot that repeats the end of the previous one.
+    
+    The overlap is built from the word runs shared by the end of the previous
+    text and the start of the current one, so a few misread words inside the
+    repeated lines don't hide it.
+    
+    Args:
+        previous (str): Text of the previous screenshot
+        current (str): Text of the current screenshot
+        window (int): Number of words compared at the end/start of each text
+        min_overlap_words (int): Fewest matching words treated as an overlap
+        slack (int): Words allowed after the overlap at the end of the previous
+            text (e.g. a garbled last line)
+        lead_slack (int): Words allowed before the overlap at the start of the
+            current text (e.g. status bar text like "9:41 LTE")
+        min_ratio (float): Share of words in the overlapping region that must
+            match (OCR misreads make up the rest)
+        
+    Returns:
+        str: Current text without the overlapping part
+    """
+    prev_words = previous.split()[-window:]
+    curr_words = current.split()
+    prev_norm = [_normalize_word(w) for w in prev_words]
+    curr_norm = [_normalize_word(w) for w in curr_words[:window]]
+    
+    matcher = difflib.SequenceMatcher(None, prev_norm, curr_norm, autojunk=False)
+    blocks = [block for block in matcher.get_matching_blocks() if block.size]
+    if not blocks:
+        return current
+    
+    # The overlap must run to (almost) the end of the previous text
+    last = blocks[-1]
+    if last.a + last.size < len(prev_norm) - slack:
+        return current
+    
+    # Grow the overlap backwards over earlier matching runs and keep the longest
+    # one that starts at (almost) the beginning of the current text and is mostly
+    # matching words. A phrase repeated further into the current text is real
+    # content, not overlap.
+    for i, first in enumerate(blocks):
+        if first.b > lead_slack:
+            continue
+        matched = sum(block.size for block in blocks[i:])
+        span = (last.a + last.size - first.a) + (last.b + last.size - first.b)
+        if matched >= min_overlap_words and 2 * matched / span >= min_ratio:
+            cut = last.b + last.size
+            logger.info(f"Removed {cut} overlapping words between screenshots")
+            return ' '.join(curr_words[cut:])
+    
+    return current
+
+def stitch_texts(texts):
+    """
+    Stitches text from consecutive screenshots into a single article.
+    
+    Args:
+        texts (list): Extracted text for each screenshot, in reading order
+        
+    Returns:
+        str: Combined article text
+    """
+    article = ""
+    for text in texts:
+        if not text:
+            continue
+        if article:
+            text = remove_overlap(article, text)
+            if text:
+                article = f"{article} {text}"
+        else:
+            article = text
+    return article
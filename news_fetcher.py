@@ -1,5 +1,7 @@
 import requests
 import logging
+import threading
+import time
 import streamlit as st
 
 # Set up logging
@@ -45,7 +47,7 @@ def get_news(api_key, category="business", country="us", page_size=10):
             url = f"https://newsapi.org/v2/top-headlines?country={country}&category={api_category}&pageSize={page_size}&apiKey={api_key}"
         
         logger.info(f"Fetching news for category: {category}")
-        response = requests.get(url)
+        response = requests.get(url, timeout=10)
         
         if response.status_code == 200:
             data = response.json()
@@ -57,4 +59,126 @@ def get_news(api_key, category="business", country="us", page_size=10):
             
     except Exception as e:
         logger.error(f"Exception in get_news: {str(e)}")
-        return None
\ No newline at end of file
+        return None
+
+# Stale-while-revalidate cache for news payloads, keyed by (category, country).
+# Lives at module level so it is shared by every Streamlit session in the process.
+NEWS_TTL = 3600  # Seconds before a cached payload is considered stale
+MISS_WAIT_TIMEOUT = 15  # Seconds a coalesced caller waits for the in-flight fetch
+RETRY_BACKOFF = 300  # Seconds to wait after a failed refresh before calling NewsAPI again
+
+_news_cache = {}
+_inflight = {}
+_cache_lock = threading.Lock()
+
+def _refresh_news(key, api_key):
+    """
+    Fetches news for a cache key and stores the result.
+
+    Keeps the previous payload if the upstream request fails, records the
+    failure time for the retry backoff, and wakes up any callers waiting on
+    the in-flight fetch.
+
+    Args:
+        key (tuple): (category, country) cache key
+        api_key (str): NewsAPI key
+    """
+    category, country = key
+    try:
+        data = get_news(api_key, category, country)
+    except Exception as e:
+        logger.error(f"Exception refreshing news for {key}: {str(e)}")
+        data = None
+
+    with _cache_lock:
+        entry = _news_cache.get(key)
+        if data is not None:
+            _news_cache[key] = {"data": data, "fetched_at": time.time(), "error": None}
+        elif entry is not None:
+            # Upstream failed, keep serving the last good payload (if any)
+            entry["error"] = time.time()
+            if entry["data"] is not None:
+                logger.warning(f"News refresh failed for {key}, serving stale data")
+        else:
+            # Cold miss failed, remember it so the backoff applies here too
+            _news_cache[key] = {"data": None, "fetched_at": None, "error": time.time()}
+        _inflight.pop(key).set()
+
+def _cache_result(entry, ttl, pending=False):
+    """
+    Builds the result dict returned to callers from a cache entry.
+
+    Args:
+        entry (dict): Cache entry or None
+        ttl (int): Freshness window in seconds
+        pending (bool): True if a fetch for this key is still in progress
+
+    Returns:
+        dict: Payload plus freshness information
+    """
+    if entry is None:
+        return {"data": None, "fetched_at": None, "stale": False, "error": not pending, "pending": pending}
+    return {
+        "data": entry["data"],
+        "fetched_at": entry["fetched_at"],
+        "stale": entry["fetched_at"] is not None and time.time() - entry["fetched_at"] > ttl,
+        "error": entry["error"] is not None,
+        "pending": pending,
+    }
+
+def get_cached_news(api_key, category="business", country="us", ttl=NEWS_TTL):
+    """
+    Returns news from a stale-while-revalidate cache.
+
+    A fresh entry is returned as is. A stale entry is returned immediately
+    while a single background thread refreshes it. On a miss, concurrent
+    callers for the same category and country share one upstream request.
+    If upstream fails the last good payload keeps being served. After any
+    failed fetch, including a failed cold miss, no new upstream request starts
+    until RETRY_BACKOFF seconds have passed.
+
+    Args:
+        api_key (str): NewsAPI key
+        category (str): News category (business, economy, etc.)
+        country (str): Country code (us, gb, etc.)
+        ttl (int): Seconds before a cached payload is refreshed
+
+    Returns:
+        dict: {"data": NewsAPI JSON or None, "fetched_at": epoch seconds or None,
+               "stale": True if older than ttl, "error": True if the last fetch failed,
+               "pending": True if the shared fetch is still running}
+    """
+    key = (category, country)
+
+    with _cache_lock:
+        entry = _news_cache.get(key)
+        # Back off after a failed fetch so an outage doesn't burn the NewsAPI quota
+        backing_off = (
+            entry is not None
+            and entry["error"] is not None
+            and time.time() - entry["error"] < RETRY_BACKOFF
+        )
+        if entry is not None and (entry["data"] is not None or backing_off):
+            result = _cache_result(entry, ttl)
+            if result["stale"] and not backing_off and key not in _inflight:
+                _inflight[key] = threading.Event()
+                threading.Thread(
+                    target=_refresh_news, args=(key, api_key), daemon=True
+                ).start()
+            return result
+
+        event = _inflight.get(key)
+        leader = event is None
+        if leader:
+            event = _inflight[key] = threading.Event()
+
+    if leader:
+        logger.info(f"News cache miss for {key}, fetching")
+        _refresh_news(key, api_key)
+        finished = True
+    else:
+        logger.info(f"News cache miss for {key}, waiting on in-flight fetch")
+        finished = event.wait(MISS_WAIT_TIMEOUT)
+
+    with _cache_lock:
+        return _cache_result(_news_cache.get(key), ttl, pending=not finished)
@@ -1,6 +1,7 @@
 import logging
 from transformers import pipeline
 import streamlit as st
+from image_analyzer import warm_ocr_pool
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -36,4 +37,7 @@ def load_summarizer_model():
             return None
 
 # Load the model at startup
-summarizer_model = load_summarizer_model()
\ No newline at end of file
+summarizer_model = load_summarizer_model()
+
+# Start the OCR worker processes in the background
+warm_ocr_pool()
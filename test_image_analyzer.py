@@ -0,0 +1,117 @@
+import random
+
+import pandas as pd
+import pytest
+
+from image_analyzer import clean_ocr_text, clean_ocr_text_batch, remove_overlap, stitch_texts
+
+OCR_TEXTS = [
+    "",
+    "Clean OCR text.",
+    "Line one\n\n\nLine two\n   \nLine three",
+    "Tabs\tand\rcarriage returns\x0b\x0c",
+    "Control\x07characters\x1f removed",
+    "Unicode\x85whitespace\xa0and\u3000ideographic space",
+    "Contains a NUL\x00character",
+    "\x00",
+    "Emoji \U0001F600 outside the BMP",
+    "Private use \ue000 and zero width\u200b space",
+    "\n\n",
+]
+
+
+def test_remove_overlap_drops_repeated_lines_and_status_bar():
+    previous = "The Federal Reserve raised rates today. Markets fell sharply as investors weighed the outlook for growth and"
+    current = "9:41 LTE investors weighed the outlook for growth and inflation next year."
+    assert remove_overlap(previous, current) == "inflation next year."
+
+
+def test_remove_overlap_tolerates_misread_words():
+    previous = ("Earlier text about the economy. The central bank said on Tuesday that it would "
+                "keep interest rates unchanged for the rest of the year")
+    current = ("9:41 The central bank said on Tuesday that it wou1d keep interest rates unchanged "
+               "for the rest of the year. Analysts expect cuts in 2025.")
+    assert remove_overlap(previous, current) == "Analysts expect cuts in 2025."
+
+
+def test_remove_overlap_tolerates_dropped_and_garbled_words():
+    previous = "Inflation cooled again in May as energy prices fell and food costs rose at a slower pace"
+    current = "energy prices fe11 and costs rose at a slower pace than economists had expected."
+    assert remove_overlap(previous, current) == "than economists had expected."
+
+
+def test_stitch_texts_removes_noisy_overlap():
+    texts = [
+        "The central bank said on Tuesday that it would keep interest rates unchanged for the rest of the year",
+        "The central bank sa1d on Tuesday that it would keep interest rates unchanged for the rest of the year. Markets rallied.",
+    ]
+    assert stitch_texts(texts) == texts[0] + " Markets rallied."
+
+
+def test_remove_overlap_keeps_text_without_overlap():
+    previous = "The Federal Reserve raised rates today."
+    current = "Bond yields rose across the curve after the decision."
+    assert remove_overlap(previous, current) == current
+
+
+def test_remove_overlap_keeps_phrase_repeated_mid_text():
+    previous = "Intro. Markets fell sharply after the announcement"
+    current = ("9:41 LTE news.com the rate decision surprised everyone while "
+               "markets fell sharply after the announcement of rates")
+    assert remove_overlap(previous, current) == current
+
+
+def test_stitch_texts_joins_screenshots_in_order():
+    texts = [
+        "The Federal Reserve raised rates today. Markets fell sharply as investors weighed the outlook for growth and",
+        None,
+        "10:42 investors weighed the outlook for growth and inflation next year. Analysts expect more hikes.",
+        "Analysts expect more hikes. Bond yields rose.",
+    ]
+    assert stitch_texts(texts) == (
+        "The Federal Reserve raised rates today. Markets fell sharply as investors weighed "
+        "the outlook for growth and inflation next year. Analysts expect more hikes. Bond yields rose."
+    )
+
+
+def test_stitch_texts_keeps_phrase_repeated_mid_text():
+    texts = [
+        "Intro. Markets fell sharply after the announcement",
+        "9:41 LTE news.com the rate decision surprised everyone while markets fell sharply after the announcement of rates",
+    ]
+    assert stitch_texts(texts) == " ".join(texts)
+
+
+def test_stitch_texts_without_text():
+    assert stitch_texts([]) == ""
+    assert stitch_texts([None, ""]) == ""
+
+
+def test_clean_ocr_text_batch_matches_scalar():
+    assert list(clean_ocr_text_batch(OCR_TEXTS)) == [clean_ocr_text(t) for t in OCR_TEXTS]
+
+
+def test_clean_ocr_text_batch_handles_missing_text():
+    assert list(clean_ocr_text_batch([None, "", float("nan"), "Some text"])) == ["", "", "", "Some text"]
+
+
+def test_clean_ocr_text_batch_keeps_series_index():
+    texts = pd.Series(OCR_TEXTS, index=range(100, 100 + len(OCR_TEXTS)))
+    result = clean_ocr_text_batch(texts)
+    assert list(result.index) == list(texts.index)
+    assert list(result) == [clean_ocr_text(t) for t in OCR_TEXTS]
+
+
+def test_clean_ocr_text_batch_empty():
+    assert list(clean_ocr_text_batch([])) == []
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_clean_ocr_text_batch_matches_scalar_on_random_texts(seed):
+    rng = random.Random(seed)
+    pieces = list("ab .!?09") + [
+        "\n", "\n  \n", "\t", "\r", "\x00", "\x07", "\x85", "\xa0",
+        "\u3000", "\u200b", "\ue000", "\U0001F600", "\U000E0001",
+    ]
+    texts = ["".join(rng.choice(pieces) for _ in range(rng.randint(0, 40))) for _ in range(200)]
+    assert list(clean_ocr_text_batch(texts)) == [clean_ocr_text(t) for t in texts]
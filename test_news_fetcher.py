@@ -0,0 +1,132 @@
+import threading
+import time
+
+import pytest
+
+import news_fetcher
+
+
+class FakeNewsAPI:
+    """Stand-in for get_news that counts calls and can fail or block."""
+
+    def __init__(self):
+        self.calls = 0
+        self.fail = False
+        self.release = threading.Event()
+        self.release.set()
+
+    def __call__(self, api_key, category="business", country="us", page_size=10):
+        self.calls += 1
+        self.release.wait(5)
+        if self.fail:
+            return None
+        return {"articles": [{"title": f"call {self.calls}"}]}
+
+
+@pytest.fixture
+def fake_api(monkeypatch):
+    monkeypatch.setattr(news_fetcher, "_news_cache", {})
+    monkeypatch.setattr(news_fetcher, "_inflight", {})
+    fake = FakeNewsAPI()
+    monkeypatch.setattr(news_fetcher, "get_news", fake)
+    return fake
+
+
+def wait_for_refresh(key=("business", "us")):
+    deadline = time.time() + 5
+    while key in news_fetcher._inflight and time.time() < deadline:
+        time.sleep(0.01)
+
+
+def test_concurrent_misses_share_one_upstream_call(fake_api):
+    fake_api.release.clear()
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(news_fetcher.get_cached_news("key")))
+        for _ in range(20)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.1)
+    fake_api.release.set()
+    for thread in threads:
+        thread.join()
+
+    assert fake_api.calls == 1
+    assert len(results) == 20
+    assert all(r["data"]["articles"][0]["title"] == "call 1" for r in results)
+    assert not any(r["error"] or r["pending"] for r in results)
+
+
+def test_fresh_entry_is_served_from_cache(fake_api):
+    news_fetcher.get_cached_news("key")
+    result = news_fetcher.get_cached_news("key")
+    assert fake_api.calls == 1
+    assert not result["stale"]
+
+
+def test_stale_entry_is_served_while_one_refresh_runs(fake_api):
+    news_fetcher.get_cached_news("key")
+    fake_api.release.clear()
+
+    results = [news_fetcher.get_cached_news("key", ttl=0) for _ in range(5)]
+    assert all(r["stale"] and r["data"]["articles"][0]["title"] == "call 1" for r in results)
+
+    fake_api.release.set()
+    wait_for_refresh()
+    assert fake_api.calls == 2
+    assert news_fetcher.get_cached_news("key")["data"]["articles"][0]["title"] == "call 2"
+
+
+def test_failed_refresh_keeps_last_good_payload_and_backs_off(fake_api):
+    news_fetcher.get_cached_news("key")
+    fake_api.fail = True
+
+    news_fetcher.get_cached_news("key", ttl=0)
+    wait_for_refresh()
+    for _ in range(5):
+        result = news_fetcher.get_cached_news("key", ttl=0)
+
+    assert fake_api.calls == 2
+    assert result["error"] and result["stale"]
+    assert result["data"]["articles"][0]["title"] == "call 1"
+
+
+def test_refresh_retries_after_backoff(fake_api, monkeypatch):
+    news_fetcher.get_cached_news("key")
+    fake_api.fail = True
+    news_fetcher.get_cached_news("key", ttl=0)
+    wait_for_refresh()
+
+    monkeypatch.setattr(news_fetcher, "RETRY_BACKOFF", 0)
+    fake_api.fail = False
+    news_fetcher.get_cached_news("key", ttl=0)
+    wait_for_refresh()
+
+    assert fake_api.calls == 3
+    result = news_fetcher.get_cached_news("key")
+    assert not result["error"]
+    assert result["data"]["articles"][0]["title"] == "call 3"
+
+
+def test_failed_cold_miss_backs_off(fake_api):
+    fake_api.fail = True
+    results = [news_fetcher.get_cached_news("key") for _ in range(5)]
+
+    assert fake_api.calls == 1
+    assert all(r["error"] and r["data"] is None and not r["pending"] for r in results)
+
+
+def test_waiter_reports_pending_fetch_after_timeout(fake_api, monkeypatch):
+    monkeypatch.setattr(news_fetcher, "MISS_WAIT_TIMEOUT", 0.05)
+    fake_api.release.clear()
+    leader = threading.Thread(target=news_fetcher.get_cached_news, args=("key",))
+    leader.start()
+    time.sleep(0.05)
+
+    result = news_fetcher.get_cached_news("key")
+    fake_api.release.set()
+    leader.join()
+
+    assert result["pending"] and not result["error"]
+    assert result["data"] is None
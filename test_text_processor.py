@@ -0,0 +1,49 @@
+import random
+
+import pandas as pd
+import pytest
+
+from text_processor import clean_text, clean_text_batch
+
+TEXTS = [
+    "",
+    "Plain text without anything to clean.",
+    "<p>Inflation rose</p><b>again</b>",
+    "<p>\nTag split across lines\n</p>",
+    "Text ending in an open tag <",
+    "> Text starting with a closing tag",
+    "Stocks fell sharply. [+2900 chars]",
+    "Stocks [+12 chars] fell [+3 chars]",
+    "Many   spaces\n\n\tand\r\nnewlines\x0b\x0c",
+    "Unicode\x85whitespace\xa0and　ideographic space",
+    "Contains a NUL\x00character",
+    "\x00",
+    "Emoji \U0001F600 outside the BMP",
+    "   ",
+]
+
+
+def test_clean_text_batch_matches_scalar():
+    assert list(clean_text_batch(TEXTS)) == [clean_text(t) for t in TEXTS]
+
+
+def test_clean_text_batch_keeps_series_index():
+    texts = pd.Series(TEXTS, index=[f"article-{i}" for i in range(len(TEXTS))])
+    result = clean_text_batch(texts)
+    assert list(result.index) == list(texts.index)
+    assert list(result) == [clean_text(t) for t in TEXTS]
+
+
+def test_clean_text_batch_empty():
+    assert list(clean_text_batch([])) == []
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_clean_text_batch_matches_scalar_on_random_texts(seed):
+    rng = random.Random(seed)
+    pieces = list("ab .!?<>[]+09") + [
+        "\n", "\t", "\x00", "\x85", "\xa0", "　", "\U0001F600",
+        "<b>", "</p>", "[+123 chars]", " chars]", "\n\x00\n",
+    ]
+    texts = ["".join(rng.choice(pieces) for _ in range(rng.randint(0, 40))) for _ in range(200)]
+    assert list(clean_text_batch(texts)) == [clean_text(t) for t in texts]
@@ -0,0 +1,102 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from url_analyzer import _ArticleTextCounter, download_page, extract_from_url
+
+PARAGRAPH = "<p>Inflation and interest rates moved again as markets weighed the outlook.</p>"
+BIG_PAGE = ("<html><head><title>News</title></head><body><h1>Title</h1>"
+            + PARAGRAPH * 5000 + "</body></html>").encode("utf-8")
+
+PAGES = {
+    "/article.html": ("text/html; charset=utf-8", BIG_PAGE),
+    "/doc.pdf": ("application/pdf", b"%PDF-1.4" + b"0" * 1000),
+    "/latin1.html": (
+        "text/html; charset=iso-8859-1",
+        "<html><body><p>Café prices rose.</p></body></html>".encode("iso-8859-1"),
+    ),
+    "/meta.html": (
+        "text/html",
+        b'<html><head><meta charset="windows-1252"></head>'
+        b"<body><p>\x93Quoted\x94 outlook</p></body></html>",
+    ),
+    "/plain.html": (
+        "text/html",
+        "<html><body><p>Yen ¥ and euro €</p></body></html>".encode("utf-8"),
+    ),
+}
+
+
+class PageHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        content_type, body = PAGES[self.path]
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), PageHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_non_html_content_type_is_skipped(server_url):
+    assert download_page(f"{server_url}/doc.pdf") is None
+    assert extract_from_url(f"{server_url}/doc.pdf") is None
+
+
+def test_download_stops_at_max_bytes(server_url):
+    html = download_page(f"{server_url}/article.html", max_bytes=1000, enough_chars=10**9)
+    assert html == BIG_PAGE[:1000].decode("utf-8")
+
+
+def test_download_stops_once_enough_article_text(server_url):
+    html = download_page(f"{server_url}/article.html", enough_chars=5000)
+    assert len(html) < len(BIG_PAGE)
+    assert html.count("<p>") * 70 >= 5000
+
+
+def test_download_reads_whole_page_below_limits(server_url):
+    html = download_page(f"{server_url}/article.html", enough_chars=10**9)
+    assert html == BIG_PAGE.decode("utf-8")
+
+
+def test_encoding_from_content_type_header(server_url):
+    assert "Café prices rose." in download_page(f"{server_url}/latin1.html")
+
+
+def test_encoding_from_meta_charset(server_url):
+    assert "“Quoted” outlook" in download_page(f"{server_url}/meta.html")
+
+
+def test_encoding_defaults_to_utf8(server_url):
+    assert "Yen ¥ and euro €" in download_page(f"{server_url}/plain.html")
+
+
+def test_counter_counts_paragraph_text():
+    counter = _ArticleTextCounter()
+    counter.feed("<p>abc</p><div>not counted</div><p>de</p>")
+    assert counter.text_chars == 5
+
+
+def test_counter_ends_unclosed_paragraph_at_block_element():
+    counter = _ArticleTextCounter()
+    counter.feed("<p>abc<div>xyz</div>not in a paragraph<p>gh<ul><li>zz</li></ul>after list")
+    assert counter.text_chars == 5
+
+
+def test_counter_skips_script_and_navigation():
+    counter = _ArticleTextCounter()
+    counter.feed("<p>abc<script>var x = 1;</script></p><nav><p>Home</p></nav><aside><p>Related</p></aside>")
+    assert counter.text_chars == 3
@@ -1,10 +1,22 @@
 import re
 import logging
+import pandas as pd
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns shared by the scalar and batch text functions
+_HTML_TAG_RE = re.compile(r'<.*?>')
+_WHITESPACE_RE = re.compile(r'\s+')
+_NEWSAPI_SUFFIX_RE = re.compile(r'\[\+\d+ chars\]')
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
+# Separator for batch processing. The newlines stop tag patterns from matching
+# across texts and the NUL sentinel is untouched by every cleaning pattern.
+_BATCH_SENTINEL = '\x00'
+_BATCH_SEPARATOR = f'\n{_BATCH_SENTINEL}\n'
+
 # Dictionary of economic terms and their simplified versions
 ECON_TERMS = {
     "inflation": "rising prices",
@@ -138,7 +150,7 @@ def create_econoclip(text, summarizer_model):
             min_length = max_length - 10
         
         # Generate summary
-        summary = summarizer_model(cleaned_text, max_length=max_length, min_length=min_length, do_sample=False)[0]['summary_text']
+        summary = summarizer_model(cleaned_text, max_length=max_length, min_length=min_length, do_sample=False, truncation=True)[0]['summary_text']
         
         # Simplify economic terms
         simplified = simplify_terms(summary)
@@ -164,16 +176,49 @@ def clean_text(text):
         str: Cleaned text
     """
     # Remove any HTML tags
-    text = re.sub(r'<.*?>', '', text)
+    text = _HTML_TAG_RE.sub('', text)
     
     # Remove multiple spaces and newlines
-    text = re.sub(r'\s+', ' ', text)
+    text = _WHITESPACE_RE.sub(' ', text)
     
     # Remove common NewsAPI suffixes like "[+2900 chars]"
-    text = re.sub(r'\[\+\d+ chars\]', '', text)
+    text = _NEWSAPI_SUFFIX_RE.sub('', text)
     
     return text.strip()
 
+def clean_text_batch(texts):
+    """
+    Batch version of clean_text for many articles at once.
+    
+    The texts are joined into one string so each precompiled pattern runs
+    once over the whole batch instead of once per text.
+    
+    Args:
+        texts (pandas.Series or list): Raw texts
+        
+    Returns:
+        pandas.Series: Cleaned texts, identical to clean_text applied to each item
+    """
+    texts = pd.Series(texts, dtype=object)
+    joined = _BATCH_SEPARATOR.join(texts)
+    
+    # Texts containing the separator itself can't be split back apart
+    if joined.count(_BATCH_SENTINEL) != max(len(texts) - 1, 0):
+        scalar_rows = texts.str.contains(_BATCH_SENTINEL, regex=False)
+        cleaned = texts.copy()
+        cleaned[scalar_rows] = texts[scalar_rows].map(clean_text)
+        cleaned[~scalar_rows] = clean_text_batch(texts[~scalar_rows])
+        return cleaned
+    
+    joined = _HTML_TAG_RE.sub('', joined)
+    # Same as _WHITESPACE_RE (str.split and \s share one definition of whitespace),
+    # but without a regex substitution for every single space
+    joined = ' '.join(joined.split())
+    joined = _NEWSAPI_SUFFIX_RE.sub('', joined)
+    
+    cleaned = [text.strip() for text in joined.split(_BATCH_SENTINEL)] if len(texts) else []
+    return pd.Series(cleaned, index=texts.index, dtype=object)
+
 def highlighted_points(text):
     """
     Formats text with highlighted key points.
@@ -185,7 +230,7 @@ def highlighted_points(text):
         str: Formatted text with highlights
     """
     # For simplicity, we'll just add a couple of bullet points
-    sentences = re.split(r'(?<=[.!?])\s+', text)
+    sentences = _SENTENCE_SPLIT_RE.split(text)
     
     # If there are fewer than 3 sentences, return the original text
     if len(sentences) < 3:
@@ -211,4 +256,4 @@ def highlighted_points(text):
     # Add the full text below
     result += f"<br><strong>Full Summary:</strong><br>{text}"
     
-    return result
\ No newline at end of file
+    return result